@@ -708,13 +708,21 @@ delete_crds() {
         "sealedsecrets.bitnami.com"
     )
 
+    # Delete concurrently: each delete blocks until its instances are finalized,
+    # so running them one after another stacks up the 30s timeouts
+    local pids=()
     for crd in "${crds[@]}"; do
         if kubectl get crd $crd &>/dev/null; then
             echo -e "${YELLOW}  → Deleting CRD: $crd${NC}"
-            kubectl delete crd $crd --timeout=30s 2>/dev/null || true
+            kubectl delete crd $crd --timeout=30s 2>/dev/null &
+            pids+=($!)
         fi
     done
 
+    if [ ${#pids[@]} -gt 0 ]; then
+        wait "${pids[@]}" 2>/dev/null || true
+    fi
+
     echo -e "${GREEN}  ✓${NC} CRDs deleted"
 }
 
@@ -360,7 +360,12 @@ deploy_directly() {
     print_header "Deploying Applications Directly"
 
     log "Deploying using kustomize..."
-    kubectl apply -k "$REPO_ROOT/environments/$ENVIRONMENT/"
+    # Server-side apply avoids the client-side three-way merge and the
+    # last-applied-configuration annotation on large ConfigMaps
+    kubectl apply -k "$REPO_ROOT/environments/$ENVIRONMENT/" \
+        --server-side \
+        --field-manager=fineract-deploy \
+        --force-conflicts
 
     log_success "Applications deployed directly"
 }
@@ -18,6 +18,12 @@
 
 set -e
 
+# Shared helpers (wait_for_job_outcome); sourced before this script's own
+# definitions so those take precedence
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+SKIP_COMMON_INIT=1
+source "${SCRIPT_DIR}/lib/common.sh"
+
 # Colors for output
 RED='\033[0;31m'
 GREEN='\033[0;32m'
@@ -27,7 +33,7 @@ NC='\033[0m' # No Color
 # Configuration
 ENVIRONMENT="${1:-dev}"
 NAMESPACE="fineract-${ENVIRONMENT}"
-KUBECONFIG_PATH="${KUBECONFIG:-~/.kube/config-fineract-${ENVIRONMENT}-${ENVIRONMENT}}"
+KUBECONFIG_PATH="${KUBECONFIG:-${HOME}/.kube/config-fineract-${ENVIRONMENT}-${ENVIRONMENT}}"
 
 echo -e "${GREEN}========================================${NC}"
 echo -e "${GREEN}Fineract Full Stack Deployment${NC}"
@@ -47,8 +53,39 @@ wait_for_pods() {
   local timeout=${3:-300}
 
   echo -e "${YELLOW}Waiting for pods with label ${label} to be ready...${NC}"
+
+  # The pods are created by ArgoCD, and kubectl wait fails immediately while
+  # no pod matches the selector, so first wait for the pods to be created,
+  # then for them to become ready
+  local deadline=$((SECONDS + timeout))
+  until [ -n "$(kubectl get pods -l "${label}" -n "${namespace}" -o name 2>/dev/null)" ]; do
+    if [ ${SECONDS} -ge ${deadline} ]; then
+      echo -e "${RED}No pods with label ${label} created within ${timeout}s${NC}"
+      return 0
+    fi
+    sleep 2
+  done
+
+  # A zero or negative timeout means "wait a week" to kubectl
+  local remaining=$((deadline - SECONDS))
+  [ "${remaining}" -lt 1 ] && remaining=1
+
   kubectl wait --for=condition=ready pod \
     -l "${label}" \
+    -n "${namespace}" \
+    --timeout="${remaining}s" || true
+}
+
+# Function to wait for a deployment rollout. Unlike a pod readiness wait, this
+# also waits for the new ReplicaSet when the deployment already exists
+wait_for_rollout() {
+  local deployment=$1
+  local namespace=$2
+  local timeout=${3:-300}
+
+  echo -e "${YELLOW}Waiting for deployment ${deployment} to roll out...${NC}"
+
+  kubectl rollout status deployment/${deployment} \
     -n "${namespace}" \
     --timeout="${timeout}s" || true
 }
@@ -60,9 +97,16 @@ wait_for_job() {
   local timeout=${3:-300}
 
   echo -e "${YELLOW}Waiting for job ${job_name} to complete...${NC}"
-  kubectl wait --for=condition=complete job/${job_name} \
-    -n "${namespace}" \
-    --timeout="${timeout}s"
+
+  # Returns as soon as the job fails instead of after the full timeout
+  if wait_for_job_outcome "${namespace}" "${job_name}" "${timeout}"; then
+    return 0
+  fi
+
+  echo -e "${RED}Job ${job_name} failed or did not complete within ${timeout}s${NC}"
+  kubectl get job ${job_name} -n "${namespace}" -o wide || true
+  kubectl logs -n "${namespace}" job/${job_name} --tail=50 || true
+  return 1
 }
 
 # Step 1: Create databases
@@ -81,13 +125,16 @@ echo ""
 
 # Step 2: Deploy Fineract components
 echo -e "${GREEN}=== Step 2: Deploying Fineract Application ===${NC}"
-kubectl apply -k environments/${ENVIRONMENT}
-
-echo -e "${YELLOW}Waiting for Fineract write pod to initialize database schema...${NC}"
-sleep 30
+# Server-side apply: the apiserver computes the merge, and large ConfigMaps
+# do not need a last-applied-configuration annotation copy
+kubectl apply -k environments/${ENVIRONMENT} \
+  --server-side \
+  --field-manager=fineract-deploy \
+  --force-conflicts
 
-# Wait for write deployment
-wait_for_pods "app=fineract,mode=write" "${NAMESPACE}" 600
+# Wait for write deployment (its readiness probe covers database schema
+# initialization)
+wait_for_rollout "fineract-write" "${NAMESPACE}" 600
 
 echo -e "${GREEN}✓ Fineract write deployment ready${NC}"
 echo ""
@@ -103,7 +150,6 @@ fi
 
 # Wait for platform services
 echo -e "${YELLOW}Waiting for platform services to be ready...${NC}"
-sleep 60
 
 # Wait for Keycloak
 wait_for_pods "app=keycloak" "${NAMESPACE}" 300
@@ -121,10 +167,10 @@ echo ""
 echo -e "${GREEN}=== Step 4: Deploying Read and Batch Services ===${NC}"
 
 # Wait for read deployment
-wait_for_pods "app=fineract,mode=read" "${NAMESPACE}" 600
+wait_for_rollout "fineract-read" "${NAMESPACE}" 600
 
 # Wait for batch deployment
-wait_for_pods "app=fineract,mode=batch" "${NAMESPACE}" 600
+wait_for_rollout "fineract-batch" "${NAMESPACE}" 600
 
 echo -e "${GREEN}✓ Read and batch services deployed${NC}"
 echo ""
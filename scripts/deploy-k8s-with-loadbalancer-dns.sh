@@ -29,6 +29,12 @@
 
 set -e
 
+# Shared helpers (wait_for_job_outcome); sourced before this script's own
+# definitions so those take precedence
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+SKIP_COMMON_INIT=1
+source "${SCRIPT_DIR}/lib/common.sh"
+
 # Colors for output
 RED='\033[0;31m'
 GREEN='\033[0;32m'
@@ -73,7 +79,6 @@ if [[ ! "$ENV" =~ ^(dev|uat|production)$ ]]; then
 fi
 
 # Change to repo root
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 REPO_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
 cd "$REPO_ROOT"
 
@@ -571,7 +576,7 @@ validate_ingress_updates() {
         log_error "  Actual:   $ingress_host"
         echo ""
         log_warn "Reapplying ingress configurations to fix..."
-        if kubectl apply -k "apps/ingress/overlays/${ENV}" --dry-run=client -o yaml | kubectl apply -f -; then
+        if kubectl apply -k "apps/ingress/overlays/${ENV}"; then
             log "✓ Ingress configuration reapplied successfully"
         else
             log_warn "Failed to reapply ingress (may need manual intervention)"
@@ -730,31 +735,16 @@ fi
 log_info "Waiting for apply-keycloak-config job to complete..."
 
 # Wait for keycloak-config job (10 minute timeout)
-MAX_WAIT=600
-ELAPSED=0
-CHECK_INTERVAL=5
-
-while [ $ELAPSED -lt $MAX_WAIT ]; do
-    JOB_STATUS=$(kubectl get job apply-keycloak-config -n fineract-${ENV} -o jsonpath='{.status.conditions[?(@.type=="Complete")].status}' 2>/dev/null || echo "")
-    JOB_FAILED=$(kubectl get job apply-keycloak-config -n fineract-${ENV} -o jsonpath='{.status.conditions[?(@.type=="Failed")].status}' 2>/dev/null || echo "")
-
-    if [ "$JOB_STATUS" = "True" ]; then
-        log "✓ Keycloak configuration job completed successfully"
-        break
-    elif [ "$JOB_FAILED" = "True" ]; then
-        log_warn "Keycloak configuration job failed!"
-        log_warn "Check logs: kubectl logs -n fineract-${ENV} job/apply-keycloak-config"
-        break
-    fi
-
-    REMAINING=$((MAX_WAIT - ELAPSED))
-    printf "\r... waiting for keycloak-config job (${ELAPSED}s elapsed, ${REMAINING}s remaining)"
-    sleep $CHECK_INTERVAL
-    ELAPSED=$((ELAPSED + CHECK_INTERVAL))
-done
-
-if [ $ELAPSED -ge $MAX_WAIT ]; then
-    log_warn "Keycloak configuration job did not complete within 10 minutes"
+JOB_RC=0
+wait_for_job_outcome "fineract-${ENV}" "apply-keycloak-config" 600 || JOB_RC=$?
+
+if [ $JOB_RC -eq 0 ]; then
+    log "✓ Keycloak configuration job completed successfully"
+elif [ $JOB_RC -eq 1 ]; then
+    log_warn "Keycloak configuration job failed!"
+    log_warn "Check logs: kubectl logs -n fineract-${ENV} job/apply-keycloak-config"
+else
+    log_warn "Keycloak configuration job did not complete within 10 minutes (or could not be waited on)"
     log_warn "This may cause OAuth2 authentication issues"
 fi
 
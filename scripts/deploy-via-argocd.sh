@@ -22,7 +22,7 @@ NC='\033[0m'
 # Configuration
 ENVIRONMENT="${1:-dev}"
 NAMESPACE="fineract-${ENVIRONMENT}"
-KUBECONFIG_PATH="${KUBECONFIG:-~/.kube/config-fineract-${ENVIRONMENT}-${ENVIRONMENT}}"
+KUBECONFIG_PATH="${KUBECONFIG:-${HOME}/.kube/config-fineract-${ENVIRONMENT}-${ENVIRONMENT}}"
 
 echo -e "${GREEN}========================================${NC}"
 echo -e "${GREEN}GitOps Deployment via ArgoCD${NC}"
@@ -156,6 +156,49 @@ wait_for_pod() {
     fi
 }
 
+# Wait for a job to complete or fail, whichever happens first
+# Returns 0 when the job completed, 1 when it failed, and 2 on timeout or
+# when kubectl wait itself errored (missing job, API failure)
+wait_for_job_outcome() {
+    local namespace="$1"
+    local job_name="$2"
+    local timeout="${3:-300}" # 5 minutes default
+
+    kubectl wait --for=condition=complete "job/$job_name" \
+        -n "$namespace" \
+        --timeout="${timeout}s" > /dev/null &
+    local complete_pid=$!
+    kubectl wait --for=condition=failed "job/$job_name" \
+        -n "$namespace" \
+        --timeout="${timeout}s" > /dev/null &
+    local failed_pid=$!
+
+    while kill -0 "$complete_pid" 2>/dev/null && kill -0 "$failed_pid" 2>/dev/null; do
+        sleep 1
+    done
+
+    # Only stop the waiter that is still running, so an error printed by one
+    # that already exited is not cut off
+    local pid
+    for pid in "$complete_pid" "$failed_pid"; do
+        if kill -0 "$pid" 2>/dev/null; then
+            kill "$pid" 2>/dev/null || true
+        fi
+    done
+
+    local complete_rc=0
+    local failed_rc=0
+    wait "$complete_pid" 2>/dev/null || complete_rc=$?
+    wait "$failed_pid" 2>/dev/null || failed_rc=$?
+
+    if [ "$complete_rc" -eq 0 ]; then
+        return 0
+    elif [ "$failed_rc" -eq 0 ]; then
+        return 1
+    fi
+    return 2
+}
+
 # Get pod status
 get_pod_status() {
     local namespace="$1"